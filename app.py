@@ -7,7 +7,7 @@ import re
 from collections import Counter
 
 # Importar módulos del proyecto
-from src.core import separar_silabas, procesar_lista_palabras
+from src.core import separar_silabas, contar_silabas, procesar_lista_palabras, metricas_legibilidad
 from src.utils import cargar_diccionario_csv
 
 
@@ -48,7 +48,7 @@ with tab1:
             with col1:
                 st.metric("Palabra Original", palabra_input.lower())
             with col2:
-                st.metric("Número de Sílabas", len(separacion.split('-')))
+                st.metric("Número de Sílabas", contar_silabas(palabra_input))
             
             st.write("**Reglas aplicadas:**")
             for regla in reglas:
@@ -205,6 +205,20 @@ with tab4:
                 # Mostrar oración completa separada
                 st.success(f"**Oración separada:** {' | '.join(oracion_separada)}")
                 
+                # Índices de legibilidad de la oración
+                metricas = metricas_legibilidad(oracion_input)
+                if metricas['palabras']:
+                    col1, col2, col3 = st.columns(3)
+                    with col1:
+                        st.metric("Sílabas por palabra", round(metricas['silabas'] / metricas['palabras'], 2))
+                    with col2:
+                        st.metric("Fernández-Huerta", round(metricas['fernandez_huerta'], 1))
+                    with col3:
+                        st.metric("Szigriszt-Pazos", round(metricas['szigriszt_pazos'], 1))
+                else:
+                    # Todas las palabras superan la longitud máxima
+                    st.info(" No hay palabras válidas para calcular los índices de legibilidad.")
+                
                 st.write("")
                 
                 # Mostrar tabla detallada
@@ -241,7 +255,7 @@ with st.expander("ℹ️ Información sobre las reglas silábicas"):
     st.markdown("""
     ### Alfabeto Lógico
     - **Vocales Fuertes (VF):** a, e, o, á, é, ó
-    - **Vocales Débiles (VD):** i, u, í, ú
+    - **Vocales Débiles (VD):** i, u, ü, í, ú
     - **Dígrafos:** ch, ll, rr (se tratan como una consonante)
     - **Grupos Inseparables:** bl, br, cl, cr, dr, fl, fr, gl, gr, pl, pr, tr, etc.
     
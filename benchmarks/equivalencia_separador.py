@@ -0,0 +1,246 @@
+# Regresión: la separación lineal coincide con el algoritmo de referencia
+#
+# Uso (desde la raíz del proyecto):
+#     python -m benchmarks.equivalencia_separador
+#
+# Compara separar_silabas con la implementación anterior (incluida abajo) sobre
+# el diccionario y sobre palabras aleatorias, con los dos conjuntos de reglas de
+# data/. Deben coincidir la separación y el conjunto de reglas aplicadas, y
+# contar_silabas debe dar el número de sílabas de la separación (0 si es
+# inválida). Termina con código 1 si encuentra alguna diferencia.
+
+import random
+import sys
+from typing import List, Optional, Tuple
+
+from src.core import ConjuntoReglas, REGLAS_PREDETERMINADAS, separar_silabas, contar_silabas
+from src.core.clasificador import (
+    es_vocal, es_consonante, es_diptongo,
+    es_digrafo, es_grupo_inseparable
+)
+from src.utils import cargar_diccionario_csv, cargar_reglas_json
+
+# Palabras aleatorias por conjunto de reglas y semilla fija (resultados reproducibles)
+PALABRAS_ALEATORIAS = 300000
+SEMILLA = 3
+
+# Letras de las palabras aleatorias: vocales con y sin tilde, mayúsculas,
+# dígrafos, una letra fuera de la tabla compilada y una cuya minúscula no es
+# alfabética ('İ' → 'i̇', la palabra es inválida)
+ALFABETO = 'aeiouáéíóúüñbcdfghjlmnprstvxyzkwqAÉΩİ'
+
+
+def separar_referencia(
+    palabra: str,
+    reglas: Optional[ConjuntoReglas] = None
+) -> Tuple[str, List[str]]:
+    """
+    Implementación de referencia (anterior a la reescritura lineal).
+    
+    Se conserva tal cual: construye cada sílaba por concatenación y
+    reconstruye el grupo de consonantes tras cada vocal.
+    
+    Args:
+        palabra: La palabra a separar en sílabas
+        reglas: Conjunto de reglas compilado (por defecto, el alfabeto español)
+        
+    Returns:
+        Tupla con (palabra_separada, lista_reglas_aplicadas)
+    """
+    reglas = reglas or REGLAS_PREDETERMINADAS
+    digrafos = reglas.digrafos
+    palabra = palabra.lower().strip()
+    
+    if not palabra or not palabra.isalpha():
+        return palabra, ["Palabra inválida"]
+    
+    n = len(palabra)
+    silabas = []
+    silaba_actual = ""
+    aplicadas = []
+    i = 0
+    
+    while i < n:
+        c = palabra[i]
+        
+        # Verificar si es parte de un dígrafo
+        if i + 1 < n and es_digrafo(c, palabra[i + 1], reglas):
+            silaba_actual += c + palabra[i + 1]
+            i += 2
+            continue
+        
+        silaba_actual += c
+        
+        # Si es consonante, seguir acumulando
+        if es_consonante(c, reglas):
+            i += 1
+            continue
+        
+        # Es vocal - analizar lo que viene después
+        if i + 1 >= n:
+            # Última letra, terminar sílaba
+            i += 1
+            continue
+        
+        siguiente = palabra[i + 1]
+        
+        # CASO 1: Siguiente es vocal
+        if es_vocal(siguiente, reglas):
+            if es_diptongo(c, siguiente, reglas):
+                # Diptongo: no separar, agregar a sílaba actual
+                aplicadas.append(f"Diptongo ({c}{siguiente})")
+                i += 1
+                continue
+            else:
+                # Hiato: separar aquí
+                aplicadas.append(f"Hiato ({c}-{siguiente})")
+                silabas.append(silaba_actual)
+                silaba_actual = ""
+                i += 1
+                continue
+        
+        if es_consonante(siguiente, reglas):
+            # Contar consonantes consecutivas
+            consonantes = ""
+            j = i + 1
+            while j < n and es_consonante(palabra[j], reglas):
+                # Verificar dígrafos
+                if j + 1 < n and es_digrafo(palabra[j], palabra[j + 1], reglas):
+                    consonantes += palabra[j] + palabra[j + 1]
+                    j += 2
+                else:
+                    consonantes += palabra[j]
+                    j += 1
+            
+            # Verificar si hay vocal después de las consonantes
+            if j >= n:
+                # No hay más vocales, todas las consonantes van con esta sílaba
+                silaba_actual += consonantes
+                i = j
+                continue
+            
+            # Hay vocal después - aplicar reglas de separación consonántica
+            num_cons = len(consonantes)
+            
+            if num_cons == 1:
+                # Una consonante entre vocales: va con la siguiente vocal (V-CV)
+                aplicadas.append("V-C-V")
+                silabas.append(silaba_actual)
+                silaba_actual = ""
+                i += 1
+                continue
+            
+            elif num_cons == 2:
+                # Verificar si es dígrafo
+                if consonantes.lower() in digrafos:
+                    # Dígrafo: va completo con la siguiente vocal
+                    aplicadas.append(f"Dígrafo ({consonantes})")
+                    silabas.append(silaba_actual)
+                    silaba_actual = ""
+                    i += 1
+                    continue
+                
+                # Verificar si es grupo inseparable
+                if es_grupo_inseparable(consonantes[0], consonantes[1], reglas):
+                    # Grupo inseparable: va completo con la siguiente vocal
+                    aplicadas.append(f"Grupo inseparable ({consonantes})")
+                    silabas.append(silaba_actual)
+                    silaba_actual = ""
+                    i += 1
+                    continue
+                
+                # Dos consonantes separables: primera con vocal anterior, segunda con siguiente
+                aplicadas.append("C-C")
+                silaba_actual += consonantes[0]
+                silabas.append(silaba_actual)
+                silaba_actual = ""
+                i += 2
+                continue
+            
+            elif num_cons >= 3:
+                # Tres o más consonantes
+                # Verificar si las últimas dos forman grupo inseparable
+                if es_grupo_inseparable(consonantes[-2], consonantes[-1], reglas):
+                    # Las primeras van con vocal anterior, grupo inseparable con siguiente
+                    aplicadas.append(f"C-C + Grupo ({consonantes[-2:]})") 
+                    silaba_actual += consonantes[:-2]
+                    silabas.append(silaba_actual)
+                    silaba_actual = ""
+                    i += 1 + len(consonantes) - 2
+                    continue
+                elif len(consonantes) >= 2 and consonantes[-2:].lower() in digrafos:
+                    # Las primeras van con vocal anterior, dígrafo con siguiente
+                    aplicadas.append(f"C + Dígrafo ({consonantes[-2:]})")
+                    silaba_actual += consonantes[:-2]
+                    silabas.append(silaba_actual)
+                    silaba_actual = ""
+                    i += 1 + len(consonantes) - 2
+                    continue
+                else:
+                    # Separar: todas menos la última van con vocal anterior
+                    aplicadas.append("C-C-C")
+                    silaba_actual += consonantes[:-1]
+                    silabas.append(silaba_actual)
+                    silaba_actual = ""
+                    i += len(consonantes)
+                    continue
+        
+        i += 1
+    
+    # Agregar última sílaba si existe
+    if silaba_actual:
+        silabas.append(silaba_actual)
+    
+    # Unir sílabas con guión
+    resultado = "-".join(silabas)
+    
+    # Si no se aplicaron reglas específicas
+    if not aplicadas:
+        aplicadas = ["Palabra simple"]
+    
+    return resultado, list(set(aplicadas))
+
+
+def palabras_de_prueba() -> List[str]:
+    """Diccionario más palabras aleatorias de 1 a 14 letras."""
+    palabras = cargar_diccionario_csv('data/diccionario_espanol.csv')
+    azar = random.Random(SEMILLA)
+    palabras += [
+        ''.join(azar.choice(ALFABETO) for _ in range(azar.randint(1, 14)))
+        for _ in range(PALABRAS_ALEATORIAS)
+    ]
+    return palabras + ['', '12', 'a b', 'chorro', 'nchll', 'instrumento']
+
+
+def main() -> None:
+    palabras = palabras_de_prueba()
+    conjuntos = [
+        REGLAS_PREDETERMINADAS,
+        cargar_reglas_json('data/reglas_es_sin_tl.json')
+    ]
+    diferencias = 0
+
+    for reglas in conjuntos:
+        for palabra in palabras:
+            esperado, reglas_esperadas = separar_referencia(palabra, reglas)
+            obtenido, reglas_obtenidas = separar_silabas(palabra, reglas, None)
+
+            iguales = esperado == obtenido and sorted(reglas_esperadas) == sorted(reglas_obtenidas)
+            if iguales:
+                silabas = 0 if reglas_obtenidas == ["Palabra inválida"] else len(obtenido.split('-'))
+                iguales = contar_silabas(palabra, reglas, None) == silabas
+
+            if not iguales:
+                diferencias += 1
+                if diferencias <= 10:
+                    print(f"{reglas.nombre}: {palabra!r}")
+                    print(f"    referencia: {esperado} {sorted(reglas_esperadas)}")
+                    print(f"    actual:     {obtenido} {sorted(reglas_obtenidas)}")
+
+    total = len(palabras) * len(conjuntos)
+    print(f"{total} palabras comparadas, {diferencias} diferencias")
+    sys.exit(1 if diferencias else 0)
+
+
+if __name__ == "__main__":
+    main()
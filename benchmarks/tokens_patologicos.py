@@ -0,0 +1,81 @@
+# Benchmark de tokens patológicos: costo por carácter según la longitud
+#
+# Uso (desde la raíz del proyecto):
+#     python -m benchmarks.tokens_patologicos
+#
+# Separa y cuenta tokens adversariales de 5 a 50,000 caracteres sin límite de
+# longitud y muestra la mediana de nanosegundos por carácter. Con tiempo
+# lineal, cada fila debe mantenerse plana: los tokens cortos pagan además el
+# costo fijo de cada llamada, así que la última columna compara 50,000 con 50
+# caracteres. Un algoritmo cuadrático la haría crecer unas mil veces.
+#
+# Las longitudes se miden intercaladas en varias rondas para que los cambios
+# de carga de la máquina no desplacen una columna entera; aun así, en máquinas
+# compartidas la última columna puede oscilar entre ~0.7 y ~1.5.
+
+import statistics
+import time
+
+from src.core import separar_silabas, contar_silabas
+
+# Patrones que se repiten hasta la longitud deseada
+PATRONES = {
+    'consonantes (OCR)': 'bcdfgkmnpstvxz',
+    'hiatos': 'ae',
+    'diptongos': 'iu',
+    'alterno CV': 'ta',
+    'grupos': 'nstra',
+    'dígrafos': 'rrchll',
+    'URL': 'httpswwwexamplecomindex',
+    'hashtag': 'NochesDeVeranoEnChiapas',
+    'químico': 'metilpropilbutanoato',
+}
+
+LONGITUDES = (5, 50, 500, 5000, 50000)
+
+# Caracteres procesados por medición (se repite el token para llegar a ellos)
+CARACTERES_POR_MEDICION = 100000
+
+# Rondas intercaladas por patrón; se reporta la mediana de cada longitud
+RONDAS = 7
+
+
+def construir_token(patron: str, longitud: int) -> str:
+    """Repite un patrón hasta la longitud indicada."""
+    return (patron * (longitud // len(patron) + 1))[:longitud]
+
+
+def medir(funcion, token: str) -> float:
+    """Retorna los nanosegundos por carácter de aplicar la función al token."""
+    repeticiones = max(1, CARACTERES_POR_MEDICION // len(token))
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        funcion(token, longitud_maxima=None)
+    return (time.perf_counter() - inicio) / (repeticiones * len(token)) * 1e9
+
+
+def medir_fila(funcion, patron: str) -> list:
+    """Mediana del costo por carácter de cada longitud, midiendo en rondas intercaladas."""
+    tokens = [construir_token(patron, n) for n in LONGITUDES]
+    muestras = [[] for _ in LONGITUDES]
+    for _ in range(RONDAS):
+        for k, token in enumerate(tokens):
+            muestras[k].append(medir(funcion, token))
+    return [statistics.median(m) for m in muestras]
+
+
+def main() -> None:
+    for funcion in (separar_silabas, contar_silabas):
+        print(f"\n{funcion.__name__} (ns/carácter)")
+        encabezado = "".join(f"{n:>9}" for n in LONGITUDES)
+        print(f"{'patrón':<20}{encabezado}{'50000/50':>12}")
+        print("-" * (20 + 9 * len(LONGITUDES) + 12))
+
+        for nombre, patron in PATRONES.items():
+            costos = medir_fila(funcion, patron)
+            fila = "".join(f"{c:>9.0f}" for c in costos)
+            print(f"{nombre:<20}{fila}{costos[-1] / costos[1]:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,13 @@ from .alfabeto import (
     GRUPOS_INSEPARABLES
 )
 
+from .reglas import (
+    ConjuntoReglas,
+    REGLAS_PREDETERMINADAS,
+    compilar_reglas,
+    reglas_desde_dict
+)
+
 from .clasificador import (
     es_vocal,
     es_vocal_fuerte,
@@ -24,7 +31,21 @@ from .clasificador import (
 
 from .separador import (
     separar_silabas,
-    procesar_lista_palabras
+    contar_silabas,
+    procesar_lista_palabras,
+    LONGITUD_MAXIMA_PALABRA
+)
+
+from .legibilidad import (
+    metricas_legibilidad,
+    metricas_documentos,
+    silabas_por_oracion
+)
+
+from .indice import (
+    IndiceSilabico,
+    construir_indice,
+    indice_desde_dict
 )
 
 __all__ = [
@@ -35,6 +56,11 @@ __all__ = [
     'VOCALES',
     'DIGRAFOS',
     'GRUPOS_INSEPARABLES',
+    # Reglas
+    'ConjuntoReglas',
+    'REGLAS_PREDETERMINADAS',
+    'compilar_reglas',
+    'reglas_desde_dict',
     # Clasificador
     'es_vocal',
     'es_vocal_fuerte',
@@ -48,5 +74,15 @@ __all__ = [
     'es_grupo_inseparable',
     # Separador
     'separar_silabas',
-    'procesar_lista_palabras'
+    'contar_silabas',
+    'procesar_lista_palabras',
+    'LONGITUD_MAXIMA_PALABRA',
+    # Legibilidad
+    'metricas_legibilidad',
+    'metricas_documentos',
+    'silabas_por_oracion',
+    # Índice
+    'IndiceSilabico',
+    'construir_indice',
+    'indice_desde_dict'
 ]
@@ -4,7 +4,8 @@
 VOCALES_FUERTES = set('aeoáéó')
 
 # Vocales débiles (pueden unirse en diptongos o formar hiato si tienen tilde)
-VOCALES_DEBILES = set('iuíú')
+# La 'ü' (diéresis) se pronuncia, por lo que es vocal débil: pin-güi-no
+VOCALES_DEBILES = set('iuüíú')
 
 # Vocales débiles acentuadas (rompen diptongo = hiato)
 VOCALES_DEBILES_ACENTUADAS = set('íú')
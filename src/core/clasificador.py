@@ -1,37 +1,39 @@
 # Funciones para clasificar caracteres según el alfabeto lógico
 
-from .alfabeto import (
-    VOCALES, VOCALES_FUERTES, VOCALES_DEBILES, 
-    VOCALES_DEBILES_ACENTUADAS, DIGRAFOS, GRUPOS_INSEPARABLES
+from typing import Optional
+
+from .reglas import (
+    ConjuntoReglas, REGLAS_PREDETERMINADAS, NOMBRES_CLASE,
+    CLASE_C, CLASE_VF, CLASE_VD, CLASE_VDA
 )
 
 
-def es_vocal(c: str) -> bool:
+def es_vocal(c: str, reglas: Optional[ConjuntoReglas] = None) -> bool:
     """Determina si un carácter es vocal."""
-    return c.lower() in VOCALES
+    return (reglas or REGLAS_PREDETERMINADAS).clase(c) >= CLASE_VF
 
 
-def es_vocal_fuerte(c: str) -> bool:
+def es_vocal_fuerte(c: str, reglas: Optional[ConjuntoReglas] = None) -> bool:
     """Determina si un carácter es vocal fuerte."""
-    return c.lower() in VOCALES_FUERTES
+    return (reglas or REGLAS_PREDETERMINADAS).clase(c) == CLASE_VF
 
 
-def es_vocal_debil(c: str) -> bool:
+def es_vocal_debil(c: str, reglas: Optional[ConjuntoReglas] = None) -> bool:
     """Determina si un carácter es vocal débil."""
-    return c.lower() in VOCALES_DEBILES
+    return (reglas or REGLAS_PREDETERMINADAS).clase(c) >= CLASE_VD
 
 
-def es_vocal_debil_acentuada(c: str) -> bool:
+def es_vocal_debil_acentuada(c: str, reglas: Optional[ConjuntoReglas] = None) -> bool:
     """Determina si es vocal débil con tilde (rompe diptongo)."""
-    return c.lower() in VOCALES_DEBILES_ACENTUADAS
+    return (reglas or REGLAS_PREDETERMINADAS).clase(c) == CLASE_VDA
 
 
-def es_consonante(c: str) -> bool:
+def es_consonante(c: str, reglas: Optional[ConjuntoReglas] = None) -> bool:
     """Determina si un carácter es consonante."""
-    return c.isalpha() and not es_vocal(c)
+    return (reglas or REGLAS_PREDETERMINADAS).clase(c) == CLASE_C
 
 
-def clasificar_caracter(c: str) -> str:
+def clasificar_caracter(c: str, reglas: Optional[ConjuntoReglas] = None) -> str:
     """
     Clasifica un carácter según el alfabeto lógico.
     
@@ -42,61 +44,53 @@ def clasificar_caracter(c: str) -> str:
         'C'   - Consonante
         'X'   - Carácter no alfabético
     """
-    c = c.lower()
-    if c in VOCALES_DEBILES_ACENTUADAS:
-        return 'VDA'
-    elif c in VOCALES_DEBILES:
-        return 'VD'
-    elif c in VOCALES_FUERTES:
-        return 'VF'
-    elif c.isalpha():
-        return 'C'
-    return 'X'
-
-
-def es_diptongo(v1: str, v2: str) -> bool:
+    return NOMBRES_CLASE[(reglas or REGLAS_PREDETERMINADAS).clase(c)]
+
+
+def es_diptongo(v1: str, v2: str, reglas: Optional[ConjuntoReglas] = None) -> bool:
     """
     Determina si dos vocales forman diptongo (NO se separan).
     
     Diptongo: VF+VD, VD+VF, VD+VD (sin tilde en la débil)
     """
-    tipo1 = clasificar_caracter(v1)
-    tipo2 = clasificar_caracter(v2)
+    reglas = reglas or REGLAS_PREDETERMINADAS
+    tipo1 = reglas.clase(v1)
+    tipo2 = reglas.clase(v2)
     
     # Si alguna vocal débil tiene tilde, es HIATO (se separa)
-    if tipo1 == 'VDA' or tipo2 == 'VDA':
+    if tipo1 == CLASE_VDA or tipo2 == CLASE_VDA:
         return False
     
     # VF + VD = Diptongo
-    if tipo1 == 'VF' and tipo2 == 'VD':
+    if tipo1 == CLASE_VF and tipo2 == CLASE_VD:
         return True
     
     # VD + VF = Diptongo
-    if tipo1 == 'VD' and tipo2 == 'VF':
+    if tipo1 == CLASE_VD and tipo2 == CLASE_VF:
         return True
     
     # VD + VD = Diptongo
-    if tipo1 == 'VD' and tipo2 == 'VD':
+    if tipo1 == CLASE_VD and tipo2 == CLASE_VD:
         return True
     
     # VF + VF = Hiato 
     return False
 
 
-def es_hiato(v1: str, v2: str) -> bool:
+def es_hiato(v1: str, v2: str, reglas: Optional[ConjuntoReglas] = None) -> bool:
     """
     Determina si dos vocales forman hiato (SE separan).
     
     Hiato: VF+VF, o cualquier combinación con VD acentuada
     """
-    return not es_diptongo(v1, v2)
+    return not es_diptongo(v1, v2, reglas)
 
 
-def es_digrafo(c1: str, c2: str) -> bool:
+def es_digrafo(c1: str, c2: str, reglas: Optional[ConjuntoReglas] = None) -> bool:
     """Determina si dos caracteres forman un dígrafo (ch, ll, rr)."""
-    return (c1 + c2).lower() in DIGRAFOS
+    return (c1 + c2).lower() in (reglas or REGLAS_PREDETERMINADAS).digrafos
 
 
-def es_grupo_inseparable(c1: str, c2: str) -> bool:
+def es_grupo_inseparable(c1: str, c2: str, reglas: Optional[ConjuntoReglas] = None) -> bool:
     """Determina si dos consonantes forman un grupo inseparable (bl, br, cl, etc.)."""
-    return (c1 + c2).lower() in GRUPOS_INSEPARABLES
+    return (c1 + c2).lower() in (reglas or REGLAS_PREDETERMINADAS).grupos_inseparables
@@ -0,0 +1,229 @@
+# Índice invertido de sílabas sobre un léxico separado
+
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
+
+from .reglas import ConjuntoReglas, REGLAS_PREDETERMINADAS
+from .separador import (
+    separar_silabas, LONGITUD_MAXIMA_PALABRA,
+    PALABRA_INVALIDA, PALABRA_DEMASIADO_LARGA
+)
+
+# Versión del formato persistido del índice
+FORMATO_INDICE = 2
+
+# Reglas con las que separar_silabas indica que no separó la palabra
+_SIN_SEPARAR = (PALABRA_INVALIDA, PALABRA_DEMASIADO_LARGA)
+
+
+@dataclass
+class IndiceSilabico:
+    """
+    Índice invertido sobre un léxico ya separado en sílabas.
+
+    Cada lista de apariciones es un array de identificadores de palabra
+    ordenados; como el léxico se guarda en orden alfabético, los resultados
+    de las consultas también lo están. Las consultas son búsquedas en
+    diccionario y no vuelven a separar ninguna palabra.
+    """
+    reglas: ConjuntoReglas
+    longitud_maxima: Optional[int]
+    palabras: List[str]
+    separaciones: List[str]
+    por_silaba: Dict[str, array]
+    por_final: Dict[str, array]
+    por_numero: Dict[int, array]
+    por_diptongo: Dict[str, array]
+
+    def _palabras_de(self, ids: Optional[array], limite: Optional[int]) -> List[str]:
+        """Convierte una lista de apariciones en palabras."""
+        if not ids:
+            return []
+        if limite is not None:
+            ids = ids[:limite]
+        palabras = self.palabras
+        return [palabras[i] for i in ids]
+
+    def separacion(self, palabra: str) -> Optional[str]:
+        """Retorna la separación indexada de una palabra, o None si no está."""
+        palabra = palabra.lower().strip()
+        i = _buscar(self.palabras, palabra)
+        return self.separaciones[i] if i is not None else None
+
+    def con_silaba(self, silaba: str, limite: Optional[int] = None) -> List[str]:
+        """Palabras que contienen la sílaba dada en cualquier posición."""
+        return self._palabras_de(self.por_silaba.get(silaba.lower()), limite)
+
+    def con_final(self, silaba: str, limite: Optional[int] = None) -> List[str]:
+        """Palabras cuya última sílaba es la dada."""
+        return self._palabras_de(self.por_final.get(silaba.lower()), limite)
+
+    def con_numero_silabas(self, numero: int, limite: Optional[int] = None) -> List[str]:
+        """Palabras con exactamente el número de sílabas dado."""
+        return self._palabras_de(self.por_numero.get(numero), limite)
+
+    def con_diptongo(self, diptongo: str, limite: Optional[int] = None) -> List[str]:
+        """Palabras en las que se aplicó la regla de diptongo indicada (p. ej. 'ue')."""
+        return self._palabras_de(self.por_diptongo.get(diptongo.lower()), limite)
+
+    def rimas(self, palabra: str, limite: Optional[int] = None) -> List[str]:
+        """
+        Palabras que comparten la última sílaba con la palabra dada.
+
+        La palabra no necesita estar en el índice: si no lo está, se separa
+        con las mismas reglas y longitud máxima con las que se construyó. La propia palabra se
+        excluye del resultado.
+        """
+        palabra = palabra.lower().strip()
+        separacion = self.separacion(palabra)
+        if separacion is None:
+            separacion, aplicadas = separar_silabas(palabra, self.reglas, self.longitud_maxima)
+            if aplicadas[0] in _SIN_SEPARAR:
+                return []
+        final = separacion.rsplit('-', 1)[-1]
+        ids = self.por_final.get(final)
+        if not ids:
+            return []
+        palabras = self.palabras
+        resultado = []
+        for i in ids:
+            if palabras[i] != palabra:
+                resultado.append(palabras[i])
+                if limite is not None and len(resultado) >= limite:
+                    break
+        return resultado
+
+    def a_dict(self) -> dict:
+        """Serializa el índice a un diccionario apto para JSON."""
+        return {
+            'formato': FORMATO_INDICE,
+            'huella_reglas': self.reglas.huella,
+            'longitud_maxima': self.longitud_maxima,
+            'palabras': self.palabras,
+            'separaciones': self.separaciones,
+            'por_silaba': {k: v.tolist() for k, v in self.por_silaba.items()},
+            'por_final': {k: v.tolist() for k, v in self.por_final.items()},
+            'por_numero': {str(k): v.tolist() for k, v in self.por_numero.items()},
+            'por_diptongo': {k: v.tolist() for k, v in self.por_diptongo.items()},
+        }
+
+
+def _buscar(palabras: List[str], palabra: str) -> Optional[int]:
+    """Búsqueda binaria de una palabra en el léxico ordenado."""
+    i = bisect_left(palabras, palabra)
+    if i < len(palabras) and palabras[i] == palabra:
+        return i
+    return None
+
+
+def _agregar(listas: dict, clave, i: int) -> None:
+    """Agrega un identificador a la lista de apariciones de una clave."""
+    ids = listas.get(clave)
+    if ids is None:
+        listas[clave] = array('I', [i])
+    else:
+        ids.append(i)
+
+
+def construir_indice(
+    palabras: Iterable[str],
+    reglas: Optional[ConjuntoReglas] = None,
+    longitud_maxima: Optional[int] = LONGITUD_MAXIMA_PALABRA
+) -> IndiceSilabico:
+    """
+    Construye el índice invertido de sílabas de un léxico.
+
+    Cada palabra se separa una sola vez. Las palabras inválidas (no
+    alfabéticas), las demasiado largas y las repetidas se descartan.
+
+    Args:
+        palabras: Léxico a indexar (p. ej. la salida de cargar_diccionario_csv)
+        reglas: Conjunto de reglas compilado (por defecto, el alfabeto español)
+        longitud_maxima: Las palabras más largas no se indexan (None
+            desactiva el límite)
+
+    Returns:
+        IndiceSilabico con las listas de sílaba, sílaba final, número de
+        sílabas y diptongo a palabras
+    """
+    reglas = reglas or REGLAS_PREDETERMINADAS
+    lexico = sorted({p.lower().strip() for p in palabras} - {''})
+
+    indice = IndiceSilabico(
+        reglas=reglas,
+        longitud_maxima=longitud_maxima,
+        palabras=[],
+        separaciones=[],
+        por_silaba={},
+        por_final={},
+        por_numero={},
+        por_diptongo={}
+    )
+
+    for palabra in lexico:
+        separacion, aplicadas = separar_silabas(palabra, reglas, longitud_maxima)
+        if aplicadas[0] in _SIN_SEPARAR:
+            continue
+
+        i = len(indice.palabras)
+        indice.palabras.append(palabra)
+        indice.separaciones.append(separacion)
+
+        silabas = separacion.split('-')
+        for silaba in dict.fromkeys(silabas):
+            _agregar(indice.por_silaba, silaba, i)
+        _agregar(indice.por_final, silabas[-1], i)
+        _agregar(indice.por_numero, len(silabas), i)
+
+        for regla in aplicadas:
+            if regla.startswith("Diptongo ("):
+                _agregar(indice.por_diptongo, regla[10:-1], i)
+
+    return indice
+
+
+def indice_desde_dict(
+    datos: dict,
+    reglas: Optional[ConjuntoReglas] = None,
+    longitud_maxima: Optional[int] = LONGITUD_MAXIMA_PALABRA
+) -> IndiceSilabico:
+    """
+    Reconstruye un índice serializado con IndiceSilabico.a_dict.
+
+    Args:
+        datos: Diccionario leído del archivo del índice
+        reglas: Conjunto de reglas con el que se espera que se haya construido
+        longitud_maxima: Longitud máxima con la que se espera que se haya construido
+
+    Returns:
+        IndiceSilabico listo para consultar
+
+    Raises:
+        ValueError: Si el formato no es compatible o si el índice se construyó
+            con otro conjunto de reglas u otra longitud máxima (hay que
+            reconstruirlo)
+    """
+    reglas = reglas or REGLAS_PREDETERMINADAS
+
+    if datos.get('formato') != FORMATO_INDICE:
+        raise ValueError(f"Formato de índice no compatible: {datos.get('formato')}")
+    if datos.get('huella_reglas') != reglas.huella:
+        raise ValueError("El índice se construyó con otro conjunto de reglas")
+    if datos.get('longitud_maxima') != longitud_maxima:
+        raise ValueError(
+            f"El índice se construyó con longitud máxima {datos.get('longitud_maxima')}, "
+            f"se esperaba {longitud_maxima}"
+        )
+
+    return IndiceSilabico(
+        reglas=reglas,
+        longitud_maxima=longitud_maxima,
+        palabras=list(datos['palabras']),
+        separaciones=list(datos['separaciones']),
+        por_silaba={k: array('I', v) for k, v in datos['por_silaba'].items()},
+        por_final={k: array('I', v) for k, v in datos['por_final'].items()},
+        por_numero={int(k): array('I', v) for k, v in datos['por_numero'].items()},
+        por_diptongo={k: array('I', v) for k, v in datos['por_diptongo'].items()},
+    )
@@ -0,0 +1,173 @@
+# Índices de legibilidad en español a partir del conteo de sílabas
+
+import re
+from functools import lru_cache
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+from .reglas import ConjuntoReglas, REGLAS_PREDETERMINADAS
+from .separador import DIPTONGO_CLASES, LONGITUD_MAXIMA_PALABRA
+
+# Expresiones sobre el texto traducido a letras de clase: 'c' consonante,
+# 'f'/'d'/'a' vocales, ' ' separador de palabras y '.' fin de oración
+_LETRA = re.compile(r'[cfda]')
+_INICIO_PALABRA = re.compile(r'\b[cfda]')
+_PALABRA_SIN_VOCAL = re.compile(r'\bc+\b')
+_INICIO_ORACION = re.compile(r'(?:\A|\.)[ .]*[cfda]')
+
+# Punto que no cierra oración: no le sigue un espacio, comillas, paréntesis
+# o el fin del fragmento (decimales como 3.5, siglas como U.S.A, URLs...)
+_PUNTO_INTERNO = re.compile(r'\.(?![\s"\'»”’)\]]|\Z)')
+
+
+@lru_cache(maxsize=None)
+def _palabras_largas(longitud_maxima: int):
+    """Expresión que encuentra las palabras de más de longitud_maxima letras."""
+    return re.compile(r'\b[cfda]{%d,}' % (longitud_maxima + 1))
+
+
+def _traducir(texto: str, reglas: Optional[ConjuntoReglas], longitud_maxima: Optional[int]) -> str:
+    """Traduce un texto a letras de clase, descartando las palabras demasiado largas."""
+    texto = _PUNTO_INTERNO.sub(' ', texto)
+    clases = (reglas or REGLAS_PREDETERMINADAS).traducir(texto)
+    if longitud_maxima is not None:
+        clases = _palabras_largas(longitud_maxima).sub(' ', clases)
+    return clases
+
+
+def _contar_clases(clases: str) -> Tuple[int, int]:
+    """
+    Cuenta palabras y sílabas de un texto traducido a letras de clase.
+
+    Sigue el mismo criterio que contar_silabas aplicado a cada palabra.
+    """
+    palabras = len(_INICIO_PALABRA.findall(clases))
+    vocales = len(clases) - clases.count('c') - clases.count(' ') - clases.count('.')
+    silabas = (
+        vocales
+        - len(DIPTONGO_CLASES.findall(clases))
+        + len(_PALABRA_SIN_VOCAL.findall(clases))
+    )
+    return palabras, silabas
+
+
+def _indices(palabras: int, silabas: int, oraciones: int) -> dict:
+    """Calcula los índices de legibilidad a partir de los totales."""
+    if not palabras:
+        fernandez_huerta = szigriszt_pazos = None
+    else:
+        silabas_por_palabra = silabas / palabras
+        palabras_por_oracion = palabras / oraciones
+        # Fernández-Huerta (con la corrección de Law, 2011)
+        fernandez_huerta = 206.84 - 60 * silabas_por_palabra - 1.02 * palabras_por_oracion
+        # Szigriszt-Pazos (índice de perspicuidad)
+        szigriszt_pazos = 206.835 - 62.3 * silabas_por_palabra - palabras_por_oracion
+
+    return {
+        'palabras': palabras,
+        'silabas': silabas,
+        'oraciones': oraciones,
+        'fernandez_huerta': fernandez_huerta,
+        'szigriszt_pazos': szigriszt_pazos
+    }
+
+
+def metricas_legibilidad(
+    texto: Union[str, Iterable[str]],
+    reglas: Optional[ConjuntoReglas] = None,
+    longitud_maxima: Optional[int] = LONGITUD_MAXIMA_PALABRA
+) -> dict:
+    """
+    Calcula los índices de legibilidad de un documento sin separar sílabas.
+
+    El documento puede darse completo o como un iterable de fragmentos
+    (p. ej. las líneas de un archivo abierto). Los fragmentos se procesan
+    de uno en uno y deben cortarse entre palabras: el fin de un fragmento
+    cuenta como un espacio. Una oración puede continuar de un fragmento al
+    siguiente.
+
+    Un punto solo cierra oración si le sigue un espacio, comillas o
+    paréntesis de cierre, o el fin del fragmento; así '3.5' no parte la
+    oración. '!', '?' y '…' siempre la cierran.
+
+    Args:
+        texto: Documento o iterable de fragmentos del documento
+        reglas: Conjunto de reglas compilado (por defecto, el alfabeto español)
+        longitud_maxima: Las palabras más largas se descartan, como en
+            contar_silabas (None desactiva el límite)
+
+    Returns:
+        Diccionario con 'palabras', 'silabas', 'oraciones', 'fernandez_huerta'
+        y 'szigriszt_pazos' (los índices son None si no hay palabras)
+    """
+    if isinstance(texto, str):
+        texto = (texto,)
+
+    palabras = silabas = oraciones = 0
+    abierta = False
+
+    for fragmento in texto:
+        clases = _traducir(fragmento, reglas, longitud_maxima)
+
+        p, s = _contar_clases(clases)
+        palabras += p
+        silabas += s
+
+        n = len(_INICIO_ORACION.findall(clases))
+        punto = clases.find('.')
+        letra = _LETRA.search(clases)
+
+        # El primer tramo continúa la oración que quedó abierta
+        if abierta and letra and (punto < 0 or letra.start() < punto):
+            n -= 1
+        oraciones += n
+
+        if punto < 0:
+            abierta = abierta or letra is not None
+        else:
+            abierta = _LETRA.search(clases, clases.rfind('.') + 1) is not None
+
+    return _indices(palabras, silabas, oraciones)
+
+
+def metricas_documentos(
+    documentos: Iterable[Union[str, Iterable[str]]],
+    reglas: Optional[ConjuntoReglas] = None,
+    longitud_maxima: Optional[int] = LONGITUD_MAXIMA_PALABRA
+) -> Iterator[dict]:
+    """
+    Calcula los índices de legibilidad de cada documento de una colección.
+
+    Args:
+        documentos: Iterable de documentos (texto o fragmentos, ver metricas_legibilidad)
+        reglas: Conjunto de reglas compilado (por defecto, el alfabeto español)
+        longitud_maxima: Longitud máxima de palabra (ver metricas_legibilidad)
+
+    Returns:
+        Iterador con el diccionario de métricas de cada documento, en orden
+    """
+    for documento in documentos:
+        yield metricas_legibilidad(documento, reglas, longitud_maxima)
+
+
+def silabas_por_oracion(
+    texto: str,
+    reglas: Optional[ConjuntoReglas] = None,
+    longitud_maxima: Optional[int] = LONGITUD_MAXIMA_PALABRA
+) -> List[int]:
+    """
+    Cuenta las sílabas de cada oración de un texto.
+
+    Args:
+        texto: Texto a analizar
+        reglas: Conjunto de reglas compilado (por defecto, el alfabeto español)
+        longitud_maxima: Longitud máxima de palabra (ver metricas_legibilidad)
+
+    Returns:
+        Lista con el número de sílabas de cada oración que contiene palabras
+    """
+    clases = _traducir(texto, reglas, longitud_maxima)
+    return [
+        _contar_clases(tramo)[1]
+        for tramo in clases.split('.')
+        if _LETRA.search(tramo)
+    ]
@@ -0,0 +1,286 @@
+# Conjuntos de reglas configurables compilados en tablas de búsqueda
+
+import hashlib
+import json
+import re
+from dataclasses import dataclass, field, replace
+from typing import Dict, FrozenSet, Iterable, Union
+
+from .alfabeto import (
+    VOCALES_FUERTES, VOCALES_DEBILES, VOCALES_DEBILES_ACENTUADAS,
+    DIGRAFOS, GRUPOS_INSEPARABLES
+)
+
+# Versión del formato compilado (forma parte de la huella: si cambia la
+# compilación, cambian las huellas y se invalidan las cachés que dependan de ellas)
+FORMATO_REGLAS = 1
+
+# Clases de carácter almacenadas en la tabla (un byte por punto de código)
+CLASE_X = 0    # Carácter no alfabético
+CLASE_C = 1    # Consonante
+CLASE_VF = 2   # Vocal fuerte
+CLASE_VD = 3   # Vocal débil
+CLASE_VDA = 4  # Vocal débil acentuada
+
+# Nombres de cada clase en el orden de sus códigos
+NOMBRES_CLASE = ('X', 'C', 'VF', 'VD', 'VDA')
+
+# Letra que representa cada clase en el texto traducido (ver ConjuntoReglas.traducir)
+LETRAS_CLASE = (' ', 'c', 'f', 'd', 'a')
+
+# Signos que cierran una oración; en el texto traducido se convierten en '.'
+# (legibilidad.py descarta antes los puntos que no van seguidos de espacio)
+TERMINADORES_ORACION = '.!?…'
+
+# Puntos de código cubiertos como mínimo por la tabla (latín básico y extendido)
+_TAMANO_MINIMO_TABLA = 0x250
+
+# Fuera de la tabla no hay vocales: las letras son consonantes y el resto separadores
+_LETRA_FUERA_DE_TABLA = re.compile(r'[^\W\d_\x00-\x7f]')
+_NO_ASCII = re.compile(r'[^\x00-\x7f]')
+_TERMINADORES_NO_ASCII = [t for t in TERMINADORES_ORACION if not t.isascii()]
+
+
+@dataclass(frozen=True, eq=False)
+class ConjuntoReglas:
+    """
+    Conjunto de reglas compilado e inmutable.
+
+    La tabla asigna una clase a cada punto de código (mayúsculas incluidas),
+    de modo que clasificar un carácter es un solo acceso indexado; por encima
+    de la tabla solo hay consonantes y caracteres no alfabéticos. Dos
+    conjuntos con el mismo contenido comparten huella y son intercambiables.
+    """
+    nombre: str
+    vocales_fuertes: FrozenSet[str]
+    vocales_debiles: FrozenSet[str]
+    vocales_debiles_acentuadas: FrozenSet[str]
+    digrafos: FrozenSet[str]
+    grupos_inseparables: FrozenSet[str]
+    tabla: bytes = field(repr=False)
+    traduccion: str = field(repr=False)
+    huella: str
+
+    def clase(self, c: str) -> int:
+        """Retorna el código de clase (CLASE_*) de un carácter (CLASE_X si no es uno solo)."""
+        if len(c) != 1:
+            return CLASE_X
+        cp = ord(c)
+        if cp < len(self.tabla):
+            return self.tabla[cp]
+        return CLASE_C if c.isalpha() else CLASE_X
+
+    def traducir(self, texto: str) -> str:
+        """
+        Reduce un texto a letras de clase (LETRAS_CLASE), una por carácter.
+
+        Los terminadores de oración se convierten en '.'.
+        """
+        clases = texto.translate(self.traduccion)
+        # Los caracteres fuera de la tabla quedan sin traducir (no ASCII)
+        if not clases.isascii():
+            for terminador in _TERMINADORES_NO_ASCII:
+                clases = clases.replace(terminador, '.')
+            clases = _LETRA_FUERA_DE_TABLA.sub('c', clases)
+            clases = _NO_ASCII.sub(' ', clases)
+        return clases
+
+    def __eq__(self, otro) -> bool:
+        if not isinstance(otro, ConjuntoReglas):
+            return NotImplemented
+        return self.huella == otro.huella
+
+    def __hash__(self) -> int:
+        return hash(self.huella)
+
+
+# Conjuntos ya compilados, indexados por huella
+_COMPILADOS: Dict[str, ConjuntoReglas] = {}
+
+
+def _normalizar_letras(valor: Union[str, Iterable[str]], campo: str) -> FrozenSet[str]:
+    """Convierte una cadena o lista de letras en un conjunto en minúsculas."""
+    if not isinstance(valor, (str, list, tuple, set, frozenset)):
+        raise ValueError(f"'{campo}' debe ser una cadena o lista de letras")
+    for c in valor:
+        if not isinstance(c, str) or len(c) != 1 or not c.isalpha():
+            raise ValueError(f"'{campo}' contiene un elemento inválido: {c!r}")
+    return frozenset(c.lower() for c in valor)
+
+
+def _normalizar_pares(valor: Iterable[str], campo: str) -> FrozenSet[str]:
+    """Convierte una lista de pares de letras en un conjunto en minúsculas."""
+    if not isinstance(valor, (list, tuple, set, frozenset)):
+        raise ValueError(f"'{campo}' debe ser una lista de pares de letras")
+    for p in valor:
+        if not isinstance(p, str) or len(p) != 2 or not p.isalpha():
+            raise ValueError(f"'{campo}' contiene un elemento inválido: {p!r}")
+    return frozenset(p.lower() for p in valor)
+
+
+def _clase_letra(c: str, fuertes, debiles, acentuadas) -> int:
+    """Clasifica un carácter (ya en minúsculas) con los conjuntos dados."""
+    if c in acentuadas:
+        return CLASE_VDA
+    if c in debiles:
+        return CLASE_VD
+    if c in fuertes:
+        return CLASE_VF
+    if c.isalpha():
+        return CLASE_C
+    return CLASE_X
+
+
+def compilar_reglas(
+    vocales_fuertes: Union[str, Iterable[str]],
+    vocales_debiles: Union[str, Iterable[str]],
+    vocales_debiles_acentuadas: Union[str, Iterable[str]],
+    digrafos: Iterable[str],
+    grupos_inseparables: Iterable[str],
+    nombre: str = "personalizado"
+) -> ConjuntoReglas:
+    """
+    Compila un conjunto de reglas en tablas de búsqueda inmutables.
+
+    Args:
+        vocales_fuertes: Letras que forman núcleo silábico propio
+        vocales_debiles: Letras que pueden formar diptongo
+        vocales_debiles_acentuadas: Vocales débiles con tilde (forman hiato);
+            deben estar también entre las débiles
+        digrafos: Pares de letras que se tratan como una sola consonante
+        grupos_inseparables: Pares de consonantes que no se separan
+        nombre: Nombre descriptivo (no forma parte de la huella)
+
+    Returns:
+        ConjuntoReglas compilado; si ya existía uno con el mismo contenido,
+        se reutiliza su tabla
+
+    Raises:
+        ValueError: Si algún elemento no es una letra o par de letras válido,
+            si una letra es a la vez vocal fuerte y débil, si una débil
+            acentuada es fuerte o no está entre las débiles, o si un dígrafo
+            o grupo contiene una vocal
+    """
+    fuertes = _normalizar_letras(vocales_fuertes, 'vocales_fuertes')
+    debiles = _normalizar_letras(vocales_debiles, 'vocales_debiles')
+    acentuadas = _normalizar_letras(vocales_debiles_acentuadas, 'vocales_debiles_acentuadas')
+    pares_digrafos = _normalizar_pares(digrafos, 'digrafos')
+    pares_grupos = _normalizar_pares(grupos_inseparables, 'grupos_inseparables')
+
+    if fuertes & debiles:
+        comunes = "".join(sorted(fuertes & debiles))
+        raise ValueError(f"Letras a la vez fuertes y débiles: {comunes}")
+
+    # Las acentuadas son un subconjunto de las débiles (como í, ú en 'iuüíú')
+    if acentuadas & fuertes:
+        comunes = "".join(sorted(acentuadas & fuertes))
+        raise ValueError(f"Letras a la vez fuertes y débiles acentuadas: {comunes}")
+    if not acentuadas <= debiles:
+        faltantes = "".join(sorted(acentuadas - debiles))
+        raise ValueError(f"Débiles acentuadas que no están entre las débiles: {faltantes}")
+
+    # Dígrafos y grupos se tratan como consonantes: no pueden contener vocales
+    vocales = fuertes | debiles | acentuadas
+    for campo, pares in (('digrafos', pares_digrafos), ('grupos_inseparables', pares_grupos)):
+        con_vocal = sorted(p for p in pares if vocales & set(p))
+        if con_vocal:
+            raise ValueError(f"'{campo}' contiene pares con vocal: {', '.join(con_vocal)}")
+
+    contenido = json.dumps({
+        'formato': FORMATO_REGLAS,
+        'vocales_fuertes': sorted(fuertes),
+        'vocales_debiles': sorted(debiles),
+        'vocales_debiles_acentuadas': sorted(acentuadas),
+        'digrafos': sorted(pares_digrafos),
+        'grupos_inseparables': sorted(pares_grupos),
+    }, ensure_ascii=False, sort_keys=True)
+    huella = hashlib.sha256(contenido.encode('utf-8')).hexdigest()
+
+    # Mismo contenido: se comparten las tablas y solo cambia el nombre
+    existente = _COMPILADOS.get(huella)
+    if existente is not None:
+        if existente.nombre != nombre:
+            return replace(existente, nombre=nombre)
+        return existente
+
+    # La tabla cubre también la mayúscula de cada vocal configurada
+    tamano = max([_TAMANO_MINIMO_TABLA] + [
+        max(ord(c), ord(c.upper()) if len(c.upper()) == 1 else 0) + 1
+        for c in vocales
+    ])
+    tabla = bytearray(tamano)
+    for cp in range(tamano):
+        c = chr(cp)
+        minuscula = c.lower()
+        if len(minuscula) != 1:
+            minuscula = c
+        tabla[cp] = _clase_letra(minuscula, fuertes, debiles, acentuadas)
+
+    reglas = ConjuntoReglas(
+        nombre=nombre,
+        vocales_fuertes=fuertes,
+        vocales_debiles=debiles,
+        vocales_debiles_acentuadas=acentuadas,
+        digrafos=pares_digrafos,
+        grupos_inseparables=pares_grupos,
+        tabla=bytes(tabla),
+        traduccion="".join(
+            '.' if chr(cp) in TERMINADORES_ORACION else LETRAS_CLASE[clase]
+            for cp, clase in enumerate(tabla)
+        ),
+        huella=huella
+    )
+    _COMPILADOS[huella] = reglas
+    return reglas
+
+
+def reglas_desde_dict(datos: dict) -> ConjuntoReglas:
+    """
+    Compila un conjunto de reglas a partir de un diccionario de configuración.
+
+    Los campos ausentes toman el valor del alfabeto predeterminado.
+
+    Args:
+        datos: Diccionario con las claves 'nombre', 'vocales_fuertes',
+            'vocales_debiles', 'vocales_debiles_acentuadas', 'digrafos'
+            y 'grupos_inseparables'
+
+    Returns:
+        ConjuntoReglas compilado
+
+    Raises:
+        ValueError: Si la configuración no es un diccionario, tiene claves
+            desconocidas o valores inválidos
+    """
+    if not isinstance(datos, dict):
+        raise ValueError("La configuración de reglas debe ser un objeto JSON")
+    if not isinstance(datos.get('nombre', ''), str):
+        raise ValueError("'nombre' debe ser una cadena")
+
+    claves = {
+        'nombre', 'vocales_fuertes', 'vocales_debiles',
+        'vocales_debiles_acentuadas', 'digrafos', 'grupos_inseparables'
+    }
+    desconocidas = set(datos) - claves
+    if desconocidas:
+        raise ValueError(f"Claves desconocidas en las reglas: {', '.join(sorted(desconocidas))}")
+
+    return compilar_reglas(
+        vocales_fuertes=datos.get('vocales_fuertes', VOCALES_FUERTES),
+        vocales_debiles=datos.get('vocales_debiles', VOCALES_DEBILES),
+        vocales_debiles_acentuadas=datos.get('vocales_debiles_acentuadas', VOCALES_DEBILES_ACENTUADAS),
+        digrafos=datos.get('digrafos', DIGRAFOS),
+        grupos_inseparables=datos.get('grupos_inseparables', GRUPOS_INSEPARABLES),
+        nombre=datos.get('nombre', 'personalizado')
+    )
+
+
+# Conjunto de reglas predeterminado (alfabeto de alfabeto.py)
+REGLAS_PREDETERMINADAS = compilar_reglas(
+    VOCALES_FUERTES,
+    VOCALES_DEBILES,
+    VOCALES_DEBILES_ACENTUADAS,
+    DIGRAFOS,
+    GRUPOS_INSEPARABLES,
+    nombre="es"
+)
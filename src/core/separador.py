@@ -1,182 +1,208 @@
 # Algoritmo principal de separación silábica (DFA)
 
-from typing import Tuple, List
-from .alfabeto import DIGRAFOS
-from .clasificador import (
-    es_vocal, es_consonante, es_diptongo,
-    es_digrafo, es_grupo_inseparable
-)
+import re
+from typing import Tuple, List, Optional
+from .reglas import ConjuntoReglas, REGLAS_PREDETERMINADAS
 
+# Pares de vocales que forman diptongo, sobre el texto traducido a letras de
+# clase (f = fuerte, d = débil, a = débil acentuada). La búsqueda anticipada
+# cuenta también los pares solapados de un triptongo.
+DIPTONGO_CLASES = re.compile(r'(?=fd|df|dd)')
 
-def separar_silabas(palabra: str) -> Tuple[str, List[str]]:
+# Siguiente vocal en el texto traducido a letras de clase
+VOCAL_CLASES = re.compile(r'[fda]')
+
+# Longitud máxima de palabra que se separa (la más larga del español ronda
+# las 25 letras); por encima se asume un token anómalo (URL, ruido de OCR...)
+LONGITUD_MAXIMA_PALABRA = 64
+
+# Reglas reportadas cuando la palabra no se separa
+PALABRA_INVALIDA = "Palabra inválida"
+PALABRA_DEMASIADO_LARGA = "Palabra demasiado larga"
+
+
+def separar_silabas(
+    palabra: str,
+    reglas: Optional[ConjuntoReglas] = None,
+    longitud_maxima: Optional[int] = LONGITUD_MAXIMA_PALABRA
+) -> Tuple[str, List[str]]:
     """
     Separa una palabra en sílabas siguiendo las reglas de la RAE.
     Simula el comportamiento de un Autómata Finito Determinista (DFA).
     
+    Cada sílaba es un tramo contiguo de la palabra, así que solo se guardan
+    posiciones de corte. Cada carácter se clasifica una vez y cada grupo de
+    consonantes se recorre como mucho dos veces: el tiempo es lineal en la
+    longitud de la palabra.
+    
     Args:
         palabra: La palabra a separar en sílabas
+        reglas: Conjunto de reglas compilado (por defecto, el alfabeto español)
+        longitud_maxima: Palabras más largas se devuelven sin separar con la
+            regla "Palabra demasiado larga" (None desactiva el límite)
         
     Returns:
         Tupla con (palabra_separada, lista_reglas_aplicadas)
     """
+    reglas = reglas or REGLAS_PREDETERMINADAS
+    digrafos = reglas.digrafos
+    grupos = reglas.grupos_inseparables
     palabra = palabra.lower().strip()
     
     if not palabra or not palabra.isalpha():
-        return palabra, ["Palabra inválida"]
+        return palabra, [PALABRA_INVALIDA]
+    
+    if longitud_maxima is not None and len(palabra) > longitud_maxima:
+        return palabra, [PALABRA_DEMASIADO_LARGA]
+    
+    # Una letra de clase por carácter: 'c' consonante, 'f'/'d'/'a' vocales
+    clases = reglas.traducir(palabra)
+    siguiente_vocal = VOCAL_CLASES.search
     
     n = len(palabra)
     silabas = []
-    silaba_actual = ""
-    reglas = []
+    aplicadas = set()
+    inicio = 0
     i = 0
     
     while i < n:
-        c = palabra[i]
-        
-        # Verificar si es parte de un dígrafo
-        if i + 1 < n and es_digrafo(c, palabra[i + 1]):
-            silaba_actual += c + palabra[i + 1]
-            i += 2
-            continue
-        
-        silaba_actual += c
-        
-        # Si es consonante, seguir acumulando
-        if es_consonante(c):
-            i += 1
+        # Consonantes (y dígrafos): pasan a la sílaba actual hasta la siguiente vocal
+        if clases[i] == 'c':
+            m = siguiente_vocal(clases, i + 1)
+            i = m.start() if m else n
             continue
         
         # Es vocal - analizar lo que viene después
         if i + 1 >= n:
             # Última letra, terminar sílaba
-            i += 1
-            continue
-        
-        siguiente = palabra[i + 1]
+            break
         
         # CASO 1: Siguiente es vocal
-        if es_vocal(siguiente):
-            if es_diptongo(c, siguiente):
+        if clases[i + 1] != 'c':
+            if DIPTONGO_CLASES.match(clases, i):
                 # Diptongo: no separar, agregar a sílaba actual
-                reglas.append(f"Diptongo ({c}{siguiente})")
-                i += 1
-                continue
+                aplicadas.add(f"Diptongo ({palabra[i:i + 2]})")
             else:
                 # Hiato: separar aquí
-                reglas.append(f"Hiato ({c}-{siguiente})")
-                silabas.append(silaba_actual)
-                silaba_actual = ""
-                i += 1
-                continue
+                aplicadas.add(f"Hiato ({palabra[i]}-{palabra[i + 1]})")
+                silabas.append(palabra[inicio:i + 1])
+                inicio = i + 1
+            i += 1
+            continue
+        
+        # CASO 2: Siguen consonantes - buscar la vocal que las cierra
+        m = siguiente_vocal(clases, i + 2)
+        if not m:
+            # No hay más vocales, todas las consonantes van con esta sílaba
+            break
+        j = m.start()
+        num_cons = j - i - 1
+        
+        # Posición donde empieza la siguiente sílaba
+        if num_cons == 1:
+            # Una consonante entre vocales: va con la siguiente vocal (V-CV)
+            aplicadas.add("V-C-V")
+            corte = i + 1
         
-        if es_consonante(siguiente):
-            # Contar consonantes consecutivas
-            consonantes = ""
-            j = i + 1
-            while j < n and es_consonante(palabra[j]):
-                # Verificar dígrafos
-                if j + 1 < n and es_digrafo(palabra[j], palabra[j + 1]):
-                    consonantes += palabra[j] + palabra[j + 1]
-                    j += 2
-                else:
-                    consonantes += palabra[j]
-                    j += 1
-            
-            # Verificar si hay vocal después de las consonantes
-            if j >= n:
-                # No hay más vocales, todas las consonantes van con esta sílaba
-                silaba_actual += consonantes
-                i = j
-                continue
-            
-            # Hay vocal después - aplicar reglas de separación consonántica
-            num_cons = len(consonantes)
-            
-            if num_cons == 1:
-                # Una consonante entre vocales: va con la siguiente vocal (V-CV)
-                reglas.append("V-C-V")
-                silabas.append(silaba_actual)
-                silaba_actual = ""
-                i += 1
-                continue
-            
-            elif num_cons == 2:
-                # Verificar si es dígrafo
-                if consonantes.lower() in DIGRAFOS:
-                    # Dígrafo: va completo con la siguiente vocal
-                    reglas.append(f"Dígrafo ({consonantes})")
-                    silabas.append(silaba_actual)
-                    silaba_actual = ""
-                    i += 1
-                    continue
-                
-                # Verificar si es grupo inseparable
-                if es_grupo_inseparable(consonantes[0], consonantes[1]):
-                    # Grupo inseparable: va completo con la siguiente vocal
-                    reglas.append(f"Grupo inseparable ({consonantes})")
-                    silabas.append(silaba_actual)
-                    silaba_actual = ""
-                    i += 1
-                    continue
-                
+        elif num_cons == 2:
+            consonantes = palabra[i + 1:j]
+            if consonantes in digrafos:
+                # Dígrafo: va completo con la siguiente vocal
+                aplicadas.add(f"Dígrafo ({consonantes})")
+                corte = i + 1
+            elif consonantes in grupos:
+                # Grupo inseparable: va completo con la siguiente vocal
+                aplicadas.add(f"Grupo inseparable ({consonantes})")
+                corte = i + 1
+            else:
                 # Dos consonantes separables: primera con vocal anterior, segunda con siguiente
-                reglas.append("C-C")
-                silaba_actual += consonantes[0]
-                silabas.append(silaba_actual)
-                silaba_actual = ""
-                i += 2
-                continue
-            
-            elif num_cons >= 3:
-                # Tres o más consonantes
-                # Verificar si las últimas dos forman grupo inseparable
-                if es_grupo_inseparable(consonantes[-2], consonantes[-1]):
-                    # Las primeras van con vocal anterior, grupo inseparable con siguiente
-                    reglas.append(f"C-C + Grupo ({consonantes[-2:]})") 
-                    silaba_actual += consonantes[:-2]
-                    silabas.append(silaba_actual)
-                    silaba_actual = ""
-                    i += 1 + len(consonantes) - 2
-                    continue
-                elif len(consonantes) >= 2 and consonantes[-2:].lower() in DIGRAFOS:
-                    # Las primeras van con vocal anterior, dígrafo con siguiente
-                    reglas.append(f"C + Dígrafo ({consonantes[-2:]})")
-                    silaba_actual += consonantes[:-2]
-                    silabas.append(silaba_actual)
-                    silaba_actual = ""
-                    i += 1 + len(consonantes) - 2
-                    continue
-                else:
-                    # Separar: todas menos la última van con vocal anterior
-                    reglas.append("C-C-C")
-                    silaba_actual += consonantes[:-1]
-                    silabas.append(silaba_actual)
-                    silaba_actual = ""
-                    i += len(consonantes)
-                    continue
+                aplicadas.add("C-C")
+                corte = i + 2
+        
+        else:
+            # Tres o más consonantes: solo importan las dos últimas
+            ultimas = palabra[j - 2:j]
+            if ultimas in grupos:
+                # Las primeras van con vocal anterior, grupo inseparable con siguiente
+                aplicadas.add(f"C-C + Grupo ({ultimas})")
+                corte = j - 2
+            elif ultimas in digrafos:
+                # Las primeras van con vocal anterior, dígrafo con siguiente
+                aplicadas.add(f"C + Dígrafo ({ultimas})")
+                corte = j - 2
+            else:
+                # Separar: todas menos la última van con vocal anterior
+                aplicadas.add("C-C-C")
+                corte = j - 1
         
-        i += 1
+        silabas.append(palabra[inicio:corte])
+        inicio = corte
+        i = j
     
-    # Agregar última sílaba si existe
-    if silaba_actual:
-        silabas.append(silaba_actual)
+    # Agregar última sílaba
+    silabas.append(palabra[inicio:])
     
     # Unir sílabas con guión
     resultado = "-".join(silabas)
     
     # Si no se aplicaron reglas específicas
-    if not reglas:
-        reglas = ["Palabra simple"]
+    if not aplicadas:
+        return resultado, ["Palabra simple"]
+    
+    return resultado, list(aplicadas)
+
+
+def contar_silabas(
+    palabra: str,
+    reglas: Optional[ConjuntoReglas] = None,
+    longitud_maxima: Optional[int] = LONGITUD_MAXIMA_PALABRA
+) -> int:
+    """
+    Cuenta las sílabas de una palabra sin construirlas.
+    
+    Da el mismo número que separar_silabas: cada sílaba tiene un único
+    núcleo vocálico y dos vocales contiguas comparten núcleo solo si forman
+    diptongo, así que basta con restar los diptongos al total de vocales.
+    
+    Args:
+        palabra: La palabra a contar
+        reglas: Conjunto de reglas compilado (por defecto, el alfabeto español)
+        longitud_maxima: Palabras más largas cuentan 0, como las inválidas
+            (None desactiva el límite)
+        
+    Returns:
+        Número de sílabas, o 0 si la palabra es inválida o demasiado larga
+    """
+    palabra = palabra.lower().strip()
+    
+    if not palabra or not palabra.isalpha():
+        return 0
+    
+    if longitud_maxima is not None and len(palabra) > longitud_maxima:
+        return 0
+    
+    clases = (reglas or REGLAS_PREDETERMINADAS).traducir(palabra)
+    vocales = len(clases) - clases.count('c')
+    
+    # Palabra sin vocales: una sola sílaba
+    if not vocales:
+        return 1
     
-    return resultado, list(set(reglas))
+    return vocales - len(DIPTONGO_CLASES.findall(clases))
 
 
-def procesar_lista_palabras(palabras: List[str]) -> List[dict]:
+def procesar_lista_palabras(
+    palabras: List[str],
+    reglas: Optional[ConjuntoReglas] = None,
+    longitud_maxima: Optional[int] = LONGITUD_MAXIMA_PALABRA
+) -> List[dict]:
     """
     Procesa una lista de palabras y retorna los resultados.
     
     Args:
         palabras: Lista de palabras a procesar
+        reglas: Conjunto de reglas compilado (por defecto, el alfabeto español)
+        longitud_maxima: Longitud máxima de palabra (ver separar_silabas)
         
     Returns:
         Lista de diccionarios con 'original', 'separacion' y 'reglas'
@@ -186,11 +212,11 @@ def procesar_lista_palabras(palabras: List[str]) -> List[dict]:
     for palabra in palabras:
         palabra = palabra.strip()
         if palabra:
-            separacion, reglas = separar_silabas(palabra)
+            separacion, aplicadas = separar_silabas(palabra, reglas, longitud_maxima)
             resultados.append({
                 'original': palabra,
                 'separacion': separacion,
-                'reglas': ", ".join(reglas)
+                'reglas': ", ".join(aplicadas)
             })
     
     return resultados
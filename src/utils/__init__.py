@@ -3,11 +3,17 @@
 from .data_loader import (
     cargar_diccionario_csv,
     cargar_palabras_txt,
-    guardar_resultados
+    guardar_resultados,
+    cargar_reglas_json,
+    guardar_indice,
+    cargar_indice
 )
 
 __all__ = [
     'cargar_diccionario_csv',
     'cargar_palabras_txt',
-    'guardar_resultados'
+    'guardar_resultados',
+    'cargar_reglas_json',
+    'guardar_indice',
+    'cargar_indice'
 ]
@@ -1,8 +1,13 @@
 # Utilidades para cargar datos de entrada
 
+import json
 import pandas as pd
 from typing import List, Optional
 
+from ..core.reglas import ConjuntoReglas, REGLAS_PREDETERMINADAS, reglas_desde_dict
+from ..core.indice import IndiceSilabico, indice_desde_dict
+from ..core.separador import LONGITUD_MAXIMA_PALABRA
+
 
 def cargar_diccionario_csv(ruta_csv: str) -> List[str]:
     """
@@ -87,3 +92,80 @@ def guardar_resultados(resultados: List[dict], ruta_salida: str) -> bool:
     except Exception as e:
         print(f"Error guardando archivo: {e}")
         return False
+
+
+def cargar_reglas_json(ruta_json: str) -> Optional[ConjuntoReglas]:
+    """
+    Carga y compila un conjunto de reglas desde un archivo JSON.
+    
+    Args:
+        ruta_json: Ruta al archivo con vocales, dígrafos y grupos inseparables
+        
+    Returns:
+        ConjuntoReglas compilado, o None si el archivo no es válido
+    """
+    try:
+        with open(ruta_json, 'r', encoding='utf-8') as f:
+            datos = json.load(f)
+        return reglas_desde_dict(datos)
+    
+    except FileNotFoundError:
+        print(f"Error: No se encontró el archivo {ruta_json}")
+        return None
+    except (json.JSONDecodeError, ValueError, TypeError) as e:
+        print(f"Error: Reglas inválidas en {ruta_json} - {e}")
+        return None
+
+
+def guardar_indice(indice: IndiceSilabico, ruta_salida: str) -> bool:
+    """
+    Guarda un índice silábico en un archivo JSON.
+    
+    Args:
+        indice: Índice construido con construir_indice
+        ruta_salida: Ruta del archivo de salida
+        
+    Returns:
+        True si se guardó correctamente, False en caso contrario
+    """
+    try:
+        with open(ruta_salida, 'w', encoding='utf-8') as f:
+            json.dump(indice.a_dict(), f, ensure_ascii=False, separators=(',', ':'))
+        return True
+    
+    except Exception as e:
+        print(f"Error guardando índice: {e}")
+        return False
+
+
+def cargar_indice(
+    ruta_json: str,
+    reglas: Optional[ConjuntoReglas] = None,
+    longitud_maxima: Optional[int] = LONGITUD_MAXIMA_PALABRA
+) -> Optional[IndiceSilabico]:
+    """
+    Carga un índice silábico guardado con guardar_indice.
+    
+    El índice solo se acepta si se construyó con el mismo conjunto de
+    reglas (misma huella) y la misma longitud máxima; en caso contrario hay
+    que reconstruirlo.
+    
+    Args:
+        ruta_json: Ruta al archivo del índice
+        reglas: Conjunto de reglas esperado (por defecto, el alfabeto español)
+        longitud_maxima: Longitud máxima de palabra esperada
+        
+    Returns:
+        IndiceSilabico, o None si el archivo no existe, no es válido o está desactualizado
+    """
+    try:
+        with open(ruta_json, 'r', encoding='utf-8') as f:
+            datos = json.load(f)
+        return indice_desde_dict(datos, reglas or REGLAS_PREDETERMINADAS, longitud_maxima)
+    
+    except FileNotFoundError:
+        print(f"Error: No se encontró el archivo {ruta_json}")
+        return None
+    except (json.JSONDecodeError, ValueError, KeyError, TypeError) as e:
+        print(f"Error: Índice inválido en {ruta_json} - {e}")
+        return None